@@ -943,6 +943,32 @@ class RollingTestCase(TestCase):
                 [str(warning.message) for warning in w],
             )
 
+        # Large int64 sort values must not lose precision when building the differences
+        with warnings.catch_warnings(record=True) as w:
+            df_full = pd.DataFrame(
+                {
+                    "a": range(5),
+                    "time": np.int64(1_600_000_000_000_000_001)
+                    + np.array([0, 1, 2, 3, 5]),
+                    "id": 1,
+                }
+            )
+
+            dataframe_functions.roll_time_series(
+                df_full,
+                column_id="id",
+                column_sort="time",
+                column_kind=None,
+                rolling_direction=1,
+                n_jobs=0,
+            )
+
+            self.assertIn(
+                "Your time stamps are not uniformly sampled, which makes rolling "
+                "nonsensical in some domains.",
+                [str(warning.message) for warning in w],
+            )
+
     def test_multicore_rolling(self):
         first_class = pd.DataFrame(
             {"a": [1, 2, 3, 4], "b": [5, 6, 7, 8], "time": range(4)}
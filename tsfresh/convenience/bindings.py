@@ -1,5 +1,6 @@
 from functools import partial
 
+import numpy as np
 import pandas as pd
 
 from tsfresh.feature_extraction.extraction import _do_extraction_on_chunk
@@ -30,16 +31,26 @@ def _feature_extraction_on_chunk_helper(
     if column_sort is not None:
         df = df.sort_values(column_sort)
 
-    chunk = df[column_id].iloc[0], df[column_kind].iloc[0], df[column_value]
+    chunk_id = df[column_id].iloc[0]
+    chunk = chunk_id, df[column_kind].iloc[0], df[column_value]
     features = _do_extraction_on_chunk(
         chunk,
         default_fc_parameters=default_fc_parameters,
         kind_to_fc_parameters=kind_to_fc_parameters,
     )
-    features = pd.DataFrame(features, columns=[column_id, "variable", "value"])
-    features["value"] = features["value"].astype("double")
 
-    return features[[column_id, "variable", "value"]]
+    # Build the result column by column: every feature belongs to the same id
+    # and the values can be written into a double array right away.
+    # The explicit dtypes keep the schema of chunks without any features.
+    return pd.DataFrame(
+        {
+            column_id: np.repeat(chunk_id, len(features)),
+            "variable": np.array(
+                [variable for _, variable, _ in features], dtype=object
+            ),
+            "value": np.array([value for _, _, value in features], dtype="double"),
+        }
+    )
 
 
 def dask_feature_extraction_on_chunk(
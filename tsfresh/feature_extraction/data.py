@@ -20,10 +20,12 @@ def _binding_helper(f, kwargs, column_sort, column_id, column_kind, column_value
         )
         result = f(chunk, **kwargs)
 
+        # The constructor already puts the columns into the expected order, so only
+        # the value column needs converting (which is a no-op if it is already double).
         result = pd.DataFrame(result, columns=[column_id, "variable", "value"])
-        result["value"] = result["value"].astype("double")
+        result["value"] = result["value"].astype("double", copy=False)
 
-        return result[[column_id, "variable", "value"]]
+        return result
 
     return wrapped_feature_extraction
 
@@ -309,8 +311,10 @@ class TsDictAdapter(PartitionedTsData):
 
     def __iter__(self):
         for kind, grouped_df in self.grouped_dict.items():
+            # the kind is shared by all groups of this data frame
+            kind = str(kind)
             for ts_id, group in grouped_df:
-                yield Timeseries(ts_id, str(kind), group[self.column_value])
+                yield Timeseries(ts_id, kind, group[self.column_value])
 
     def __len__(self):
         return sum(grouped_df.ngroups for grouped_df in self.grouped_dict.values())
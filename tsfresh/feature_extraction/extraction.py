@@ -371,11 +371,13 @@ def _do_extraction_on_chunk(
                 else:
                     result = [("", func(x))]
 
+            # The kind and calculator part of the name is the same for all results of func
+            name_prefix = str(kind) + "__" + func.__name__
             for key, item in result:
-                feature_name = str(kind) + "__" + func.__name__
                 if key:
-                    feature_name += "__" + str(key)
-                yield (sample_id, feature_name, item)
+                    yield (sample_id, name_prefix + "__" + str(key), item)
+                else:
+                    yield (sample_id, name_prefix, item)
 
     with warnings.catch_warnings():
         if not show_warnings:
@@ -46,6 +46,9 @@ def from_columns(columns, columns_to_ignore=None):
     if columns_to_ignore is None:
         columns_to_ignore = []
 
+    # Many columns share the same feature calculator, so remember the names we already validated
+    known_feature_names = set()
+
     for col in columns:
         if col in columns_to_ignore:
             continue
@@ -65,20 +68,18 @@ def from_columns(columns, columns_to_ignore=None):
         kind = parts[0]
         feature_name = parts[1]
 
-        if kind not in kind_to_fc_parameters:
-            kind_to_fc_parameters[kind] = {}
+        fc_parameters = kind_to_fc_parameters.setdefault(kind, {})
 
-        if not hasattr(feature_calculators, feature_name):
-            raise ValueError("Unknown feature name {}".format(feature_name))
+        if feature_name not in known_feature_names:
+            if not hasattr(feature_calculators, feature_name):
+                raise ValueError("Unknown feature name {}".format(feature_name))
+            known_feature_names.add(feature_name)
 
         config = get_config_from_string(parts)
         if config:
-            if feature_name in kind_to_fc_parameters[kind]:
-                kind_to_fc_parameters[kind][feature_name].append(config)
-            else:
-                kind_to_fc_parameters[kind][feature_name] = [config]
+            fc_parameters.setdefault(feature_name, []).append(config)
         else:
-            kind_to_fc_parameters[kind][feature_name] = None
+            fc_parameters[feature_name] = None
 
     return kind_to_fc_parameters
 
@@ -396,7 +396,8 @@ def get_feature_type(feature_column):
     :type feature_column: pandas.Series
     :return: 'constant', 'binary' or 'real'
     """
-    n_unique_values = len(set(feature_column.values))
+    # Like a set of the values, count every NaN as a value of its own
+    n_unique_values = feature_column.nunique() + feature_column.isnull().sum()
     if n_unique_values == 1:
         return "constant"
     elif n_unique_values == 2:
@@ -234,6 +234,6 @@ class FeatureSelector(BaseEstimator, TransformerMixin):
             raise RuntimeError("You have to call fit before.")
 
         if isinstance(X, pd.DataFrame):
-            return X.copy().loc[:, self.relevant_features]
+            return X.loc[:, self.relevant_features]
         else:
             return X[:, self.relevant_features]
@@ -356,11 +356,11 @@ class RelevantFeatureAugmenter(BaseEstimator, TransformerMixin):
         X_augmented = relevant_feature_extractor.transform(X)
 
         if self.filter_only_tsfresh_features:
-            return X_augmented.copy().loc[
+            return X_augmented.loc[
                 :, self.feature_selector.relevant_features + X.columns.tolist()
             ]
         else:
-            return X_augmented.copy().loc[:, self.feature_selector.relevant_features]
+            return X_augmented.loc[:, self.feature_selector.relevant_features]
 
     def fit_transform(self, X, y):
         """
@@ -380,9 +380,7 @@ class RelevantFeatureAugmenter(BaseEstimator, TransformerMixin):
         """
         X_augmented = self._fit_and_augment(X, y)
 
-        selected_features = X_augmented.copy().loc[
-            :, self.feature_selector.relevant_features
-        ]
+        selected_features = X_augmented.loc[:, self.feature_selector.relevant_features]
 
         if self.filter_only_tsfresh_features:
             selected_features = pd.merge(
@@ -6,6 +6,7 @@ Utility functions for handling the DataFrame conversions to the internal normali
 (see ``normalize_input_to_internal_representation``) or on how to handle ``NaN`` and ``inf`` in the DataFrames.
 """
 import warnings
+from itertools import repeat
 
 import numpy as np
 import pandas as pd
@@ -33,15 +34,16 @@ def check_for_nans_in_columns(df, columns=None):
     """
     if columns is None:
         columns = df.columns
+    elif not pd.api.types.is_list_like(columns):
+        columns = [columns]
 
-    if pd.isnull(df.loc[:, columns]).any().any():
-        if not isinstance(columns, list):
-            columns = list(columns)
+    # a single pass gives us both whether and where NaNs are present
+    has_nans = pd.isnull(df.loc[:, columns]).any()
+
+    if has_nans.any():
         raise ValueError(
             "Columns {} of DataFrame must not contain NaN values".format(
-                df.loc[:, columns]
-                .columns[pd.isnull(df.loc[:, columns]).sum() > 0]
-                .tolist()
+                has_nans.index[has_nans].tolist()
             )
         )
 
@@ -158,11 +160,12 @@ def impute_dataframe_range(df_impute, col_to_max, col_to_min, col_to_median):
             "to replace"
         )
 
-    # Make the replacement dataframes as large as the real one
-    col_to_max = pd.DataFrame([col_to_max] * len(df_impute), index=df_impute.index)
-    col_to_min = pd.DataFrame([col_to_min] * len(df_impute), index=df_impute.index)
-    col_to_median = pd.DataFrame(
-        [col_to_median] * len(df_impute), index=df_impute.index
+    # Broadcast the replacement values over all rows - this gives read-only views
+    # in the shape of df_impute instead of really repeating them for every row
+    col_to_max = np.broadcast_to([col_to_max[col] for col in columns], df_impute.shape)
+    col_to_min = np.broadcast_to([col_to_min[col] for col in columns], df_impute.shape)
+    col_to_median = np.broadcast_to(
+        [col_to_median[col] for col in columns], df_impute.shape
     )
 
     df_impute.where(df_impute.values != np.PINF, other=col_to_max, inplace=True)
@@ -191,7 +194,7 @@ def get_range_values_per_column(df):
     masked = np.ma.masked_invalid(data)
     columns = df.columns
 
-    is_col_non_finite = masked.mask.sum(axis=0) == masked.data.shape[0]
+    is_col_non_finite = masked.mask.all(axis=0)
 
     if np.any(is_col_non_finite):
         # We have columns that does not contain any finite value at all, so we will store 0 instead.
@@ -230,14 +233,13 @@ def restrict_input_to_index(df_or_dict, column_id, index):
     :raise: ``TypeError`` if df_or_dict is not of type dict or pandas.DataFrame
     """
     if isinstance(df_or_dict, pd.DataFrame):
-        ids_in_df = set(df_or_dict[column_id])
-        ids_in_index = set(index)
-        present_ids = ids_in_index & ids_in_df
-        if not present_ids:
+        # the same mask tells us if any id is shared and which rows to keep
+        is_present = df_or_dict[column_id].isin(index)
+        if not is_present.any():
             msg = "The ids of the time series container and the index of the input data X do not share any identifier!"
             raise AttributeError(msg)
 
-        df_or_dict_restricted = df_or_dict[df_or_dict[column_id].isin(index)]
+        df_or_dict_restricted = df_or_dict[is_present]
     elif isinstance(df_or_dict, dict):
         df_or_dict_restricted = {
             kind: restrict_input_to_index(df, column_id, index)
@@ -343,7 +345,7 @@ def _roll_out_time_series(
         else:
             timeshift_value = timeshift - 1
         # and now create new ones ids out of the old ones
-        df_temp["id"] = df_temp[column_id].apply(lambda row: (row, timeshift_value))
+        df_temp["id"] = list(zip(df_temp[column_id], repeat(timeshift_value)))
 
         return df_temp
 
@@ -506,27 +508,31 @@ def roll_time_series(
 
         df = df.sort_values(column_sort)
 
-        if df[column_sort].dtype != np.object:
-            # if rolling is enabled, the data should be uniformly sampled in this column
-            # Build the differences between consecutive time sort values
+    # The grouping is used for the sampling check as well as for the rolling itself
+    grouped_data = df.groupby(grouper)
+
+    if column_sort is not None and df[column_sort].dtype != np.object:
+        # if rolling is enabled, the data should be uniformly sampled in this column
+        # Build the differences between consecutive time sort values
 
-            differences = df.groupby(grouper)[column_sort].apply(
-                lambda x: x.values[:-1] - x.values[1:]
+        differences = grouped_data[column_sort].apply(
+            lambda x: x.values[:-1] - x.values[1:]
+        )
+        # Reduce each group separately instead of collecting everything in one big list
+        differences = [d for d in differences if len(d) > 0]
+        # Test if all differences are the same
+        if differences and min(d.min() for d in differences) != max(
+            d.max() for d in differences
+        ):
+            warnings.warn(
+                "Your time stamps are not uniformly sampled, which makes rolling "
+                "nonsensical in some domains."
             )
-            # Write all of them into one big list
-            differences = sum(map(list, differences), [])
-            # Test if all differences are the same
-            if differences and min(differences) != max(differences):
-                warnings.warn(
-                    "Your time stamps are not uniformly sampled, which makes rolling "
-                    "nonsensical in some domains."
-                )
 
     # Roll the data frames if requested
     rolling_amount = np.abs(rolling_direction)
     rolling_direction = np.sign(rolling_direction)
 
-    grouped_data = df.groupby(grouper)
     prediction_steps = grouped_data.count().max().max()
 
     max_timeshift = max_timeshift or prediction_steps
@@ -625,16 +631,10 @@ def make_forecasting_frame(x, kind, max_timeshift, rolling_direction):
         max_timeshift=max_timeshift,
     )
 
-    # drop the rows which should actually be predicted
-    def mask_first(x):
-        """
-        this mask returns an array of 1s where the last entry is a 0
-        """
-        result = np.ones(len(x))
-        result[-1] = 0
-        return result
-
-    mask = df_shift.groupby(["id"])["id"].transform(mask_first).astype(bool)
+    # drop the rows which should actually be predicted.
+    # df_shift is already sorted by id and time, so these are
+    # the last occurrences of each id - no need to group again.
+    mask = df_shift["id"].duplicated(keep="last")
     df_shift = df_shift[mask]
 
     # Now create the target vector out of the values
@@ -643,8 +643,8 @@ def make_forecasting_frame(x, kind, max_timeshift, rolling_direction):
     y = df["value"][1:]
 
     # make sure that the format is the same as the
-    # df_shift index
-    y.index = map(lambda x: ("id", x), y.index)
+    # df_shift index (flat tuples, not a MultiIndex)
+    y.index = pd.Index(list(zip(repeat("id"), y.index)), tupleize_cols=False)
 
     return df_shift, y
 
@@ -709,17 +709,9 @@ def add_sub_time_series_index(
         grouper.append(column_kind)
 
     def _add_id_column(df_chunk):
-        chunk_length = len(df_chunk)
-        last_chunk_number = chunk_length // sub_length
-        reminder = chunk_length % sub_length
-
-        indices = np.concatenate(
-            [
-                np.repeat(np.arange(last_chunk_number), sub_length),
-                np.repeat(last_chunk_number, reminder),
-            ]
-        )
-        assert len(indices) == chunk_length
+        # The sub-package of each row follows directly from its position,
+        # the last package being shorter if sub_length does not divide the length
+        indices = np.arange(len(df_chunk)) // sub_length
 
         if column_id:
             indices = list(zip(indices, df_chunk[column_id]))
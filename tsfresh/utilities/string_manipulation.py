@@ -26,17 +26,16 @@ def get_config_from_string(parts):
     if not relevant_parts:
         return
 
-    config_kwargs = [s.rsplit("_", 1)[0] for s in relevant_parts]
-    config_values = [s.rsplit("_", 1)[1] for s in relevant_parts]
-
     dict_if_configs = {}
 
-    for key, value in zip(config_kwargs, config_values):
-        if value.lower() == "nan":
+    # split every part only once into its parameter name and value
+    for key, value in (s.rsplit("_", 1) for s in relevant_parts):
+        lower_value = value.lower()
+        if lower_value == "nan":
             dict_if_configs[key] = np.NaN
-        elif value.lower() == "-inf":
+        elif lower_value == "-inf":
             dict_if_configs[key] = np.NINF
-        elif value.lower() == "inf":
+        elif lower_value == "inf":
             dict_if_configs[key] = np.PINF
         else:
             dict_if_configs[key] = ast.literal_eval(value)